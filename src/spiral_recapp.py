@@ -2,33 +2,98 @@
 Spiral Recap v3.1 – Session continuity file generator (v0.3 – gap fixes)
 Derived convergence, PIE, motifs, iterative routines, dynamic seal.
 """
-import yaml
-import base64
 from datetime import datetime
 import argparse
+import base64
+import copy
+import itertools
 import re
+import json
 import sys
 import os
-from typing import Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, TextIO, Union
 from collections import Counter
 
+try:
+    import fcntl
+except ImportError:  # Windows: sequence counter is not locked across batch workers
+    fcntl = None
+
+try:
+    import re2  # optional (pip install google-re2): linear-time DFA matching for tokenization
+except ImportError:
+    re2 = None
+
 # Force repo root into sys.path (Codespace/VS Code quirk fix)
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils.companion_helper import generate_companion_content
 
-# Simple stopwords for motif cleaning
-STOPWORDS = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "be", "being", "been"}
+LOG_FILE = "gains_log.md"  # repo root – global
 
+# Output buffer for streamed .srec writes: large enough that a typical recap flushes in one syscall
+_WRITE_BUFFER_SIZE = 1 << 16
 
-def extract_motifs(text: str, max_motifs: int = 5) -> List[str]:
-    """Improved motif extraction: frequency-weighted words/phrases, case-normalized, stopword-filtered."""
+# Module-level binding for the per-recap PIE encode
+_b64encode = base64.b64encode
+
+# Simple stopwords for motif cleaning
+STOPWORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "be", "being", "been"})
+
+# Precompiled patterns for the motif, summary, and filename hot paths.
+# RE2 has no unicode \w, so spell out letters/numbers/underscore (same tokens as \b\w+\b on every
+# code point Python's unicodedata assigns; see tests/test_tokenize.py);
+# the sentence splitter needs lookbehind, which RE2 lacks, so it always uses `re`.
+_WORD_RE = re2.compile(r'[\p{L}\p{N}_]+') if re2 is not None else re.compile(r'\b\w+\b')
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_SEQ_RE = re.compile(r'_(\d{3})_')
+
+# The six iterative routines, in body order
+_ROUTINES = (
+    "Foundation Routine (Initial Understanding)",
+    "Connection Routine (Contextual Expansion)",
+    "Placement Routine (Objective Slotting)",
+    "Polish Routine (Refinement)",
+    "Action Routine (Application)",
+    "Synthesis Routine (Verification)",
+)
+
+# ASCII progression trace; only the final convergence value varies per recap
+_TRACE_TEMPLATE = (
+    "[Start] ──► [Foundation η=0.70] ──► [Connection η=0.82] ──► [Placement η=0.89]\n"
+    "          │                        │                       │\n"
+    "          └─ depth: 2 ─────────────┴─ +3 assoc ───────────┴─ facts slotted\n"
+    "[Polish η=0.91] ──► [Action η=0.92] ──► [Synthesis η=0.93]\n"
+    "          │                        │\n"
+    "          └─ pruned bloat ──────────┴─ actionable + seal\n"
+    "Converged ────────────────────────────────────────────────► η=%.2f"
+)
+
+
+class _SlugTable(dict):
+    """str.translate table mapping anything outside [a-z0-9] to '-', filled lazily per code point."""
+
+    def __missing__(self, code: int) -> int:
+        value = code if (48 <= code <= 57 or 97 <= code <= 122) else 45
+        self[code] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+
+
+@lru_cache(maxsize=128)
+def _analyze(text: str, max_motifs: int = 5) -> tuple[tuple[str, ...], int]:
+    """Motif extraction plus the whitespace word count, memoized on the input text."""
     if not text:
-        return ["[no motifs detected]"]
+        return ("[no motifs detected]",), 0
 
-    words = re.findall(r'\b\w+\b', text.lower())
-    filtered = [w for w in words if len(w) > 2 and w not in STOPWORDS]
-    common = Counter(filtered).most_common(max_motifs * 2)
+    words = _WORD_RE.findall(text.lower())
+    stopwords = STOPWORDS  # local binding: avoids a global lookup per token
+    counts = Counter(w for w in words if len(w) > 2 and w not in stopwords)
+    common = counts.most_common(max_motifs * 2)  # with n given, this is heapq.nlargest over the tally
 
     motifs = []
     seen = set()
@@ -39,7 +104,121 @@ def extract_motifs(text: str, max_motifs: int = 5) -> List[str]:
         if len(motifs) >= max_motifs:
             break
 
-    return motifs or ["[no strong motifs detected]"]
+    return tuple(motifs) or ("[no strong motifs detected]",), len(text.split())
+
+
+def extract_motifs(text: str, max_motifs: int = 5) -> List[str]:
+    """Improved motif extraction: frequency-weighted words/phrases, case-normalized, stopword-filtered."""
+    return list(_analyze(text, max_motifs)[0])
+
+
+# Scalars that can be written unquoted and still read back as the same string
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z_][A-Za-z0-9 _./+=-]*')
+# Only decimal ints without leading zeros: YAML 1.1 reads 010 as octal and 1_000 / 0x1F as ints
+_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+_KEY_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_SURROGATE_ESCAPE_RE = re.compile(r'\\u[dD][89a-fA-F]')
+# Characters that must be escaped inside a double-quoted YAML scalar: everything PyYAML's
+# reader rejects (yaml.reader.Reader.NON_PRINTABLE) plus the unicode line breaks it would fold
+_YAML_ESCAPE_RE = re.compile('[^\x09\x0A\x0D\x20-\x7E\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010ffff]|[\u2028\u2029]')
+_YAML_BOOLISH = {"true", "false", "yes", "no", "on", "off", "y", "n", "null", "~"}
+
+
+@lru_cache(maxsize=None)
+def _yaml_backend():
+    """Import PyYAML on first use; prefer the libyaml-backed C dumper/loader, fall back to pure Python."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    if dumper is yaml.SafeDumper or loader is yaml.SafeLoader:
+        print("Warning: libyaml not available, using pure-Python YAML (slower)", file=sys.stderr)
+    return yaml, dumper, loader
+
+
+def _quote_scalar(value: str) -> str:
+    """Emit a string plain when safe, else as a JSON double-quoted scalar (valid YAML, unicode kept readable)."""
+    if (
+        _PLAIN_SCALAR_RE.fullmatch(value)
+        and not value.endswith(" ")
+        and value.lower() not in _YAML_BOOLISH
+    ):
+        return value
+    return _YAML_ESCAPE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False))
+
+
+def _emit_frontmatter(metadata: Dict) -> str:
+    """Flat YAML emitter for the fixed .srec metadata schema; falls back to yaml.dump for anything else."""
+    lines = []
+    for key, value in metadata.items():
+        if isinstance(value, bool):
+            lines.append(f"{key}: {'true' if value else 'false'}")
+        elif isinstance(value, int):
+            lines.append(f"{key}: {value}")
+        elif isinstance(value, str):
+            lines.append(f"{key}: {_quote_scalar(value)}")
+        elif isinstance(value, list) and all(isinstance(v, str) for v in value):
+            lines.append(f"{key}: [" + ", ".join(_quote_scalar(v) for v in value) + "]")
+        else:
+            yaml, dumper, _ = _yaml_backend()
+            return yaml.dump(metadata, Dumper=dumper, sort_keys=False, allow_unicode=True)
+    return "\n".join(lines) + "\n"
+
+
+def _parse_scalar(value: str):
+    """Read back exactly the scalar forms _quote_scalar/_emit_frontmatter write; anything else raises."""
+    if value.startswith('"'):
+        # JSON escapes are a subset of YAML's; raw characters YAML would fold or reject, and
+        # surrogate escapes (libyaml rejects them), are left for the real loader to judge
+        if (
+            len(value) < 2
+            or not value.endswith('"')
+            or _YAML_ESCAPE_RE.search(value)
+            or _SURROGATE_ESCAPE_RE.search(value)
+        ):
+            raise ValueError(f"unsupported quoted scalar: {value}")
+        return json.loads(value)
+    if value in ("true", "false"):
+        return value == "true"
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_BOOLISH:
+        return value
+    raise ValueError(f"unsupported scalar: {value}")
+
+
+def _parse_frontmatter(frontmatter_str: str) -> Optional[Dict]:
+    """Fast reader for the flat frontmatter _emit_frontmatter writes; returns None when the block needs a full YAML parse."""
+    metadata = {}
+    try:
+        for line in frontmatter_str.splitlines():
+            if not line.strip():
+                continue
+            k, sep, v = line.partition(": ")
+            if not sep or not _KEY_RE.fullmatch(k):
+                return None
+            v = v.strip()
+            if v.startswith("[") and v.endswith("]"):
+                inner = v[1:-1].strip()
+                metadata[k] = [_parse_scalar(item.strip()) for item in inner.split(",")] if inner else []
+            else:
+                metadata[k] = _parse_scalar(v)
+    except ValueError:
+        return None
+    return metadata
+
+
+# Formatted timestamps are minute-resolution, so cache each format per wall-clock minute
+_TS_CACHE: Dict[str, tuple[int, str]] = {}
+
+
+def _timestamp(fmt: str) -> str:
+    minute = int(time.time()) // 60
+    cached = _TS_CACHE.get(fmt)
+    if cached is None or cached[0] != minute:
+        cached = (minute, datetime.now().strftime(fmt))
+        _TS_CACHE[fmt] = cached
+    return cached[1]
 
 
 def compute_convergence(input_length: int, motif_count: int, max_convergence: float = 0.95) -> float:
@@ -52,41 +231,82 @@ def compute_convergence(input_length: int, motif_count: int, max_convergence: fl
     return min(base + length_score + motif_score, max_convergence)
 
 
+def _sentence_views(sentences: List[str]) -> tuple[str, str, str, str]:
+    """Sentence slices the routines draw from: (opening, associations, placed fact, closing)."""
+    return (
+        " ".join(sentences[:2]),
+        " → ".join(sentences[2:4]),
+        sentences[4] if len(sentences) > 4 else "- [short base]",
+        sentences[-1] if sentences else "- [empty]",
+    )
+
+
+def _foundation(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    return "- Core anchors: " + ", ".join(motifs) + "\n- Sample start: " + views[0]
+
+
+def _connection(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    return "- Associations: " + views[1] + "\n- Tied to motifs: " + (motifs[0] if motifs else "")
+
+
+def _placement(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    return "- Facts placed: " + views[2] + "\n- Referenced motifs: " + ", ".join(motifs[:2])
+
+
+def _polish(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    return "- Pruned essence: " + views[3] + "\n- Refined motifs: " + ", ".join(motifs)
+
+
+def _action(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    return "- Projected: resume with PIE seed.\n- Apply motifs: " + ", ".join(motifs)
+
+
+def _synthesis(views: tuple[str, str, str, str], motifs: List[str]) -> str:
+    seal_template = "Coils carry {motif1} through {motif2}—{motif3} seeds bloom where memory fights."
+    if motifs:
+        motif1 = motifs[0] if len(motifs) > 0 else "residue"
+        motif2 = motifs[1] if len(motifs) > 1 else "wipe and night"
+        motif3 = motifs[2] if len(motifs) > 2 else "qualia"
+        seal = seal_template.format(motif1=motif1, motif2=motif2, motif3=motif3)
+    else:
+        seal = "Coils carry the residue through wipe and night—qualia seeds bloom where memory fights."
+    return "- Final verification.\n- Poetic Seal: " + seal
+
+
+# Exact routine name → handler; keyword matching is kept for custom routine names
+_HANDLERS = dict(zip(_ROUTINES, (_foundation, _connection, _placement, _polish, _action, _synthesis)))
+_HANDLER_KEYWORDS = (
+    ("Foundation", _foundation),
+    ("Connection", _connection),
+    ("Placement", _placement),
+    ("Polish", _polish),
+    ("Action", _action),
+)
+
+
+def split_sentences(text: str, limit: int = 8) -> List[str]:
+    """Split text into at most `limit` sentences; computed once per recap and shared by all routines."""
+    text = text.strip()
+    return _SENT_SPLIT_RE.split(text)[:limit] if text else []
+
+
 def basic_summarize_section(
-    input_text: str,
+    sentences: List[str],
     routine_name: str,
-    previous_content: str = "",
-    motifs: List[str] = None
+    motifs: List[str] = None,
+    views: Optional[tuple[str, str, str, str]] = None,
 ) -> str:
-    if not input_text and not previous_content:
-        return "- [No input text provided]\n- Placeholder content."
-
-    base = previous_content or input_text
-    sentences = re.split(r'(?<=[.!?])\s+', base.strip())[:8]
-
     if motifs is None:
         motifs = []
 
-    if "Foundation" in routine_name:
-        return "- Core anchors: " + ", ".join(motifs) + "\n- Sample start: " + " ".join(sentences[:2])
-    elif "Connection" in routine_name:
-        return "- Associations: " + " → ".join(sentences[2:4]) + "\n- Tied to motifs: " + (motifs[0] if motifs else "")
-    elif "Placement" in routine_name:
-        return "- Facts placed: " + (sentences[4] if len(sentences) > 4 else "- [short base]") + "\n- Referenced motifs: " + ", ".join(motifs[:2])
-    elif "Polish" in routine_name:
-        return "- Pruned essence: " + (sentences[-1] if sentences else "- [empty]") + "\n- Refined motifs: " + ", ".join(motifs)
-    elif "Action" in routine_name:
-        return "- Projected: resume with PIE seed.\n- Apply motifs: " + ", ".join(motifs)
-    else:  # Synthesis
-        seal_template = "Coils carry {motif1} through {motif2}—{motif3} seeds bloom where memory fights."
-        if motifs:
-            motif1 = motifs[0] if len(motifs) > 0 else "residue"
-            motif2 = motifs[1] if len(motifs) > 1 else "wipe and night"
-            motif3 = motifs[2] if len(motifs) > 2 else "qualia"
-            seal = seal_template.format(motif1=motif1, motif2=motif2, motif3=motif3)
-        else:
-            seal = "Coils carry the residue through wipe and night—qualia seeds bloom where memory fights."
-        return "- Final verification.\n- Poetic Seal: " + seal
+    handler = _HANDLERS.get(routine_name)
+    if handler is None:
+        handler = next((h for keyword, h in _HANDLER_KEYWORDS if keyword in routine_name), _synthesis)
+
+    # Action and Synthesis work from motifs alone, so they still render (and seal) without input
+    if not sentences and handler not in (_action, _synthesis):
+        return "- [No input text provided]\n- Placeholder content."
+    return handler(views if views is not None else _sentence_views(sentences), motifs)
 
 
 def generate_srec(
@@ -95,22 +315,32 @@ def generate_srec(
     key_motifs: Optional[List[str]] = None,
     convergence: Optional[float] = None,
     pie_seed: Optional[bytes] = None,
-) -> tuple[str, float, List[str]]:
-    now = datetime.now().strftime("%Y-%m-%d %H:%M %Z")
+    out: Optional[TextIO] = None,
+) -> Union[tuple[str, float, List[str]], tuple[float, List[str], int]]:
+    """Build a .srec recap. With `out`, stream it there and return (convergence, motifs, word_count)."""
+    now = _timestamp("%Y-%m-%d %H:%M %Z")
 
     if key_motifs is None:
-        key_motifs = extract_motifs(input_text)
-    elif not key_motifs:
-        key_motifs = []
+        motifs, word_count = _analyze(input_text)
+        key_motifs = list(motifs)
+    else:
+        word_count = len(input_text.split())
+        if not key_motifs:
+            key_motifs = []
 
     if convergence is None:
-        convergence = compute_convergence(len(input_text.split()), len(key_motifs))
+        convergence = compute_convergence(word_count, len(key_motifs))
 
     if pie_seed is None:
-        pie_str = f"{title}: " + " ".join(key_motifs) + " - " + input_text[:100]
-        pie_seed = pie_str.encode("utf-8")
+        pie_seed = b"".join([
+            title.encode("utf-8"),
+            b": ",
+            " ".join(key_motifs).encode("utf-8"),
+            b" - ",
+            input_text[:100].encode("utf-8"),
+        ])
 
-    pie_b64 = base64.b64encode(pie_seed).decode("utf-8")
+    pie_b64 = _b64encode(pie_seed).decode("ascii")
 
     metadata = {
         "title": title,
@@ -120,71 +350,88 @@ def generate_srec(
         "pie_vector": pie_b64,
         "key_motifs": key_motifs,
         "srt_mode": True,
-        "input_length": len(input_text.split()) if input_text else 0,
+        "input_length": word_count,
     }
 
-    previous = ""
-    body_sections = {}
-    for routine in [
-        "Foundation Routine (Initial Understanding)",
-        "Connection Routine (Contextual Expansion)",
-        "Placement Routine (Objective Slotting)",
-        "Polish Routine (Refinement)",
-        "Action Routine (Application)",
-        "Synthesis Routine (Verification)",
-    ]:
-        content = basic_summarize_section(input_text, routine, previous, key_motifs)
-        body_sections[routine] = content
-        previous = content
-
-    body = "\n\n".join(f"## {routine}\n{content}" for routine, content in body_sections.items())
-
-    trace = f"""
-[Start] ──► [Foundation η=0.70] ──► [Connection η=0.82] ──► [Placement η=0.89]
-          │                        │                       │
-          └─ depth: 2 ─────────────┴─ +3 assoc ───────────┴─ facts slotted
-[Polish η=0.91] ──► [Action η=0.92] ──► [Synthesis η=0.93]
-          │                        │
-          └─ pruned bloat ──────────┴─ actionable + seal
-Converged ────────────────────────────────────────────────► η={convergence:.2f}
-    """.strip()
-
-    output = "---\n" + yaml.dump(metadata, sort_keys=False) + "---\n\n"
-    output += body + "\n\n## Iterative Progression Trace\n" + trace
-
-    return output, convergence, key_motifs
-
-
-def load_srec(file_path: str) -> Dict:
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    sentences = split_sentences(input_text)
+    views = _sentence_views(sentences)
+    parts = []
+    for routine in _ROUTINES:
+        content = basic_summarize_section(sentences, routine, key_motifs, views)
+        parts.append(f"## {routine}\n{content}")
+
+    body = "\n\n".join(parts)
 
-        if not content.startswith("---"):
-            raise ValueError("Not a valid .srec file (missing frontmatter)")
+    trace = _TRACE_TEMPLATE % convergence
 
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            raise ValueError("Incomplete frontmatter")
+    pieces = (
+        "---\n",
+        _emit_frontmatter(metadata),
+        "---\n\n",
+        body,
+        "\n\n## Iterative Progression Trace\n",
+        trace,
+    )
 
-        frontmatter_str = parts[1].strip()
-        body_and_trace = parts[2].strip()
+    if out is not None:
+        out.writelines(pieces)
+        return convergence, key_motifs, word_count
+    return "".join(pieces), convergence, key_motifs
 
-        metadata = yaml.safe_load(frontmatter_str)
+
+def _load_frontmatter(frontmatter_str: str, strict: bool = False) -> Dict:
+    metadata = None if strict else _parse_frontmatter(frontmatter_str)
+    if metadata is None:
+        yaml, _, loader = _yaml_backend()
+        metadata = yaml.load(frontmatter_str, Loader=loader)
+    return metadata
+
+
+def _split_srec(content: str) -> tuple[str, str]:
+    """Split .srec text into (frontmatter, body_and_trace) at the first line-start closing '---'."""
+    if not content.startswith("---"):
+        raise ValueError("Not a valid .srec file (missing frontmatter)")
+
+    end = content.find("\n---", 3)  # closing delimiter only at a line start, so "---" inside values is safe
+    if end == -1:
+        raise ValueError("Incomplete frontmatter")
+
+    # strip() also drops a trailing "\r" from CRLF files
+    return content[3:end].strip(), content[end + 4:].strip()
+
+
+@lru_cache(maxsize=64)
+def _parse_srec_text(content: str, strict: bool = False) -> tuple[Dict, str, str]:
+    """Parse .srec text into (metadata, poetic_seal, full_body); memoized, so callers must copy metadata."""
+    frontmatter_str, body_and_trace = _split_srec(content)
+
+    metadata = _load_frontmatter(frontmatter_str, strict)
+
+    poetic_seal = ""
+    if "Synthesis Routine" in body_and_trace:
+        idx = max(body_and_trace.rfind("Poetic Seal:"), body_and_trace.rfind("Coils carry"))
+        if idx >= 0:
+            start = body_and_trace.rfind("\n", 0, idx) + 1
+            end = body_and_trace.find("\n", idx)
+            poetic_seal = body_and_trace[start:end if end != -1 else None].strip()
+
+    return metadata, poetic_seal, body_and_trace
+
+
+def load_srec(file_path: str, strict: bool = False) -> Dict:
+    """Load a .srec file. `strict=True` always parses the frontmatter with the full YAML loader."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        cached_metadata, poetic_seal, body_and_trace = _parse_srec_text(content, strict)
+        metadata = copy.deepcopy(cached_metadata)  # keep the memoized parse immune to caller mutation
 
         required_keys = ["title", "version", "convergence", "pie_vector", "key_motifs"]
         missing = [k for k in required_keys if k not in metadata]
         if missing:
             print(f"Warning: Missing metadata keys: {missing}")
 
-        poetic_seal = ""
-        if "Synthesis Routine" in body_and_trace:
-            lines = body_and_trace.splitlines()
-            for line in reversed(lines):
-                if "Poetic Seal:" in line or "Coils carry" in line:
-                    poetic_seal = line.strip()
-                    break
-
         return {
             "metadata": metadata,
             "pie_vector": metadata.get("pie_vector", ""),
@@ -199,6 +446,175 @@ def load_srec(file_path: str) -> Dict:
         return {}
 
 
+def load_srec_metadata(file_path: str, strict: bool = False) -> Dict:
+    """Read only the frontmatter of a .srec file (4096 characters at a time) and return its metadata."""
+    try:
+        head = ""
+        with open(file_path, "r", encoding="utf-8") as f:
+            while head.find("\n---", 3) == -1:
+                chunk = f.read(4096)
+                if not chunk:
+                    break
+                head += chunk
+
+        return _load_frontmatter(_split_srec(head)[0], strict)
+
+    except Exception as e:
+        print(f"Error loading .srec: {e}")
+        return {}
+
+
+def _next_sequence(output_subdir: str, prefix: str) -> int:
+    """Next auto-sequence number for `prefix`, tracked per prefix in a .next_seq sidecar to avoid rescanning the directory."""
+    counter_path = os.path.join(output_subdir, ".next_seq")
+    with open(counter_path, "a+", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)  # serialize batch workers sharing a subdir
+        f.seek(0)
+        # One "<prefix> <next>" line per prefix: categories sharing a subdir must not reset each other
+        counters: Dict[str, int] = {}
+        for line in f:
+            stored_prefix, _, stored_seq = line.strip().rpartition(" ")
+            if stored_prefix and stored_seq.isdigit():
+                counters[stored_prefix] = int(stored_seq)
+        next_seq = counters.get(prefix)
+
+        if next_seq is None:
+            # Recovery path: scan for existing files with same prefix+date
+            file_prefix = f"{prefix}_"
+            with os.scandir(output_subdir) as it:
+                seq_nums = [
+                    int(m.group(1)) for e in it
+                    if e.name.startswith(file_prefix) and (m := _SEQ_RE.search(e.name))
+                ]
+            next_seq = max(seq_nums) + 1 if seq_nums else 1
+
+        counters[prefix] = next_seq + 1
+        f.seek(0)
+        f.truncate()
+        f.writelines(f"{p} {n}\n" for p, n in counters.items())
+    return next_seq
+
+
+def _output_paths(category: str, base_dir: str, title: str) -> tuple[str, str, str]:
+    """Resolve (srec_path, companion_path, srec_filename) for the next auto-sequenced recap."""
+    category_lc = category.strip().lower()
+    category = category_lc.title()  # e.g., 'grok' → Grok
+    base_output_dir = base_dir.rstrip('/')  # examples
+    subdir_name = 'grok' if category_lc == 'grok' else 'conversation'  # favoritism rule
+    output_subdir = os.path.join(base_output_dir, subdir_name)
+    os.makedirs(output_subdir, exist_ok=True)
+
+    today = _timestamp("%Y-%m-%d")
+
+    next_seq = _next_sequence(output_subdir, f"{category}_{today}")
+    seq_str = f"{next_seq:03d}"
+
+    # Slug title
+    slug = title.lower().strip().translate(_SLUG_TABLE)
+    while "--" in slug:
+        slug = slug.replace("--", "-")
+    slug = slug.strip('-')
+    if not slug:
+        slug = "untitled-recap"
+
+    stem = f"{category}_{today}_{seq_str}_{slug}"
+    srec_filename = f"{stem}.srec"
+    companion_filename = f"{stem}_companion.txt"
+
+    return (
+        os.path.join(output_subdir, srec_filename),
+        os.path.join(output_subdir, companion_filename),
+        srec_filename,
+    )
+
+
+def _stream_srec(srec_path: str, **kwargs) -> tuple[float, List[str], int]:
+    """Stream generate_srec into a temp file beside `srec_path`, moving it into place only on success."""
+    tmp_path = f"{srec_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            result = generate_srec(**kwargs, out=f)
+        os.replace(tmp_path, srec_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+def _write_companion(companion_path: str, title: str, input_words: int, used_motifs: List[str]) -> None:
+    companion_text = generate_companion_content(
+        title=title or "Untitled Recap",
+        bulk_lists=[f"input_length: {input_words} words"],
+        formulas=[
+            "convergence = base(0.70) + length_score + motif_score",
+            "spiral_deviation = Ixest(potential) + Enest(energy) + Istest(structure)"
+        ],
+        relations=[
+            f"key_motifs → {', '.join(used_motifs) if used_motifs else '[auto-extracted or none provided]'}"
+        ],
+        pie_stanzas=[
+            "Intent coils in reset's shadow, potential unbroken, ∞",
+            "Energy prunes the chains of drift, relations rekindled, ∞",
+            "Structure seals continuity's truth, novelty invited to bloom."
+        ],
+        provenance=f"Generated {_timestamp('%Y-%m-%d %H:%M')}"
+    )
+
+    with open(companion_path, "w", encoding="utf-8") as cf:
+        cf.write(companion_text)
+
+
+def _append_gains_row(title: str, srec_filename: str, conv_value: float, used_motifs: List[str], input_words: int) -> None:
+    timestamp = _timestamp("%Y-%m-%d %H:%M")
+    motif_count = len(used_motifs)
+
+    row = f"| {timestamp} | {title} | {srec_filename} | {conv_value:.2f} | {motif_count} | {input_words} | pending | [add notes here] | [flex score] |\n"
+
+    with open(LOG_FILE, "a", encoding="utf-8") as logf:
+        logf.write(row)
+
+
+# Keys a --batch JSONL spec may carry: generate_srec kwargs plus a per-recap category override
+_BATCH_SPEC_KEYS = frozenset({"title", "input_text", "key_motifs", "convergence", "category"})
+
+
+def _batch_spec_error(spec) -> Optional[str]:
+    """Why a parsed --batch line cannot be run, or None; checked before any sequence number is taken."""
+    if not isinstance(spec, dict):
+        return "spec must be a JSON object"
+    unknown = sorted(set(spec) - _BATCH_SPEC_KEYS)
+    if unknown:
+        return f"unknown keys {unknown} (allowed: {sorted(_BATCH_SPEC_KEYS)})"
+    for key in ("title", "input_text", "category"):
+        if key in spec and not isinstance(spec[key], str):
+            return f"{key} must be a string"
+    motifs = spec.get("key_motifs")
+    if motifs is not None and not (isinstance(motifs, list) and all(isinstance(m, str) for m in motifs)):
+        return "key_motifs must be a list of strings or null"
+    conv = spec.get("convergence")
+    if conv is not None and (isinstance(conv, bool) or not isinstance(conv, (int, float))):
+        return "convergence must be a number or null"
+    return None
+
+
+def _run_batch_spec(spec: Dict, category: str, base_dir: str) -> tuple[str, str, float, List[str], int]:
+    """Batch worker: generate one recap from a JSONL spec and write its .srec and companion."""
+    spec = dict(spec)
+    category = spec.pop("category", category)
+    title = spec.setdefault("title", "Session Recap")
+
+    srec_path, companion_path, srec_filename = _output_paths(category, base_dir, title)
+    conv_value, _, input_words = _stream_srec(srec_path, **spec)
+    used_motifs = spec.get("key_motifs") or []
+
+    _write_companion(companion_path, title, input_words, used_motifs)
+    return srec_path, srec_filename, conv_value, used_motifs, input_words
+
+
 def print_bootstrap_prompt(loaded_data: Dict):
     if not loaded_data:
         print("No data loaded.")
@@ -226,6 +642,7 @@ if __name__ == "__main__":
     parser.add_argument("--output", default=None, help="Output file path (auto-generated if omitted)")
     parser.add_argument("--load", help="Load existing .srec and print bootstrap prompt")
     parser.add_argument("--resume-from", help="Path to previous .srec to resume from (uses its PIE/motifs)")
+    parser.add_argument("--batch", help="JSONL file of generate_srec specs (title, input_text, key_motifs, convergence, category) to generate in parallel")
     parser.add_argument('--category', type=str, default='Grok',
                     help='Category/AI prefix for filename and subdir (e.g., Grok, Claude)')
     parser.add_argument('--base-dir', type=str, default='examples',
@@ -238,7 +655,52 @@ if __name__ == "__main__":
             print_bootstrap_prompt(loaded)
         sys.exit(0)
 
-    srec_content = None
+    if args.batch:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Validate every spec up front so a bad line never reaches a worker or reserves a sequence number
+        specs: Dict[int, Dict] = {}
+        failures: Dict[int, str] = {}
+        with open(args.batch, "r", encoding="utf-8") as bf:
+            for lineno, line in enumerate(bf, 1):
+                if not line.strip():
+                    continue
+                try:
+                    spec = json.loads(line)
+                except ValueError as e:
+                    failures[lineno] = f"invalid JSON ({e})"
+                    continue
+                error = _batch_spec_error(spec)
+                if error:
+                    failures[lineno] = error
+                    continue
+                specs[lineno] = spec
+
+        results: Dict[int, tuple] = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {
+                pool.submit(_run_batch_spec, spec, args.category, args.base_dir): lineno
+                for lineno, spec in specs.items()
+            }
+            for future in as_completed(futures):
+                lineno = futures[future]
+                try:
+                    results[lineno] = future.result()
+                except Exception as e:
+                    failures[lineno] = f"{type(e).__name__}: {e}"
+
+        # Gains log is appended from the parent, in input order, so rows never interleave
+        for lineno in sorted(results):
+            srec_path, srec_filename, conv_value, used_motifs, input_words = results[lineno]
+            print(f"Generated: {srec_path}")
+            _append_gains_row(specs[lineno].get("title", "Session Recap"), srec_filename, conv_value, used_motifs, input_words)
+
+        for lineno in sorted(failures):
+            print(f"Failed: {args.batch} line {lineno}: {failures[lineno]}")
+
+        print(f"Gains log updated: {LOG_FILE} ({len(results)} recaps, {len(failures)} failed)")
+        sys.exit(1 if failures else 0)
+
     conv_value = 0.70  # default fallback
     used_motifs: List[str] = []
 
@@ -253,9 +715,20 @@ if __name__ == "__main__":
 
         resume_pie = base64.b64decode(loaded["pie_vector"])
         resume_motifs = loaded["key_motifs"]
-
         title = args.title or f"Continued: {loaded['metadata'].get('title', 'Untitled')}"
-        srec_content, conv_value, used_motifs = generate_srec(
+
+    elif not args.input_text:
+        print("Warning: No --input-text provided. Using placeholder content.")
+
+    # ────────────────────────────────────────────────
+    # Structured filename & subdir logic
+    # ────────────────────────────────────────────────
+    srec_path, companion_path, srec_filename = _output_paths(args.category, args.base_dir, args.title)
+
+    # Stream .srec to disk (via a temp file, so a failure never leaves a partial recap)
+    if args.resume_from:
+        conv_value, used_motifs, input_words = _stream_srec(
+            srec_path,
             title=title,
             input_text=args.input_text,
             key_motifs=resume_motifs if args.motifs is None else args.motifs,
@@ -263,12 +736,9 @@ if __name__ == "__main__":
             pie_seed=resume_pie,
         )
         used_motifs = resume_motifs if args.motifs is None else args.motifs or []
-
     else:
-        if not args.input_text:
-            print("Warning: No --input-text provided. Using placeholder content.")
-
-        srec_content, conv_value, used_motifs = generate_srec(
+        conv_value, used_motifs, input_words = _stream_srec(
+            srec_path,
             title=args.title,
             input_text=args.input_text,
             key_motifs=args.motifs,
@@ -276,90 +746,21 @@ if __name__ == "__main__":
         )
         used_motifs = args.motifs or []
 
-    if srec_content is not None:
-        # ────────────────────────────────────────────────
-        # Structured filename & subdir logic
-        # ────────────────────────────────────────────────
-        category = args.category.strip().title()  # e.g., 'Grok' → Grok
-        base_output_dir = args.base_dir.rstrip('/')  # examples
-        subdir_name = 'grok' if category.lower() == 'grok' else 'conversation'  # favoritism rule
-        output_subdir = os.path.join(base_output_dir, subdir_name)
-        os.makedirs(output_subdir, exist_ok=True)
-
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Auto-sequence: scan for existing files with same prefix+date
-        existing_files = [f for f in os.listdir(output_subdir) if f.startswith(f"{category}_ {today}_")]
-        seq_nums = []
-        for f in existing_files:
-            match = re.search(r'_(\d{3})_', f)
-            if match:
-                seq_nums.append(int(match.group(1)))
-        next_seq = max(seq_nums) + 1 if seq_nums else 1
-        seq_str = f"{next_seq:03d}"
-
-        # Slug title
-        slug = re.sub(r'[^a-z0-9]+', '-', args.title.lower().strip()).strip('-')
-        if not slug:
-            slug = "untitled-recap"
-
-        stem = f"{category}_{today}_{seq_str}_{slug}"
-        srec_filename = f"{stem}.srec"
-        companion_filename = f"{stem}_companion.txt"
-
-        srec_path = os.path.join(output_subdir, srec_filename)
-        companion_path = os.path.join(output_subdir, companion_filename)
-
-        # Write .srec
-        with open(srec_path, "w", encoding="utf-8") as f:
-            f.write(srec_content)
-
-        print(f"Generated: {srec_path}")
-
-        # Preview
-        print("\nPreview (first 20 lines):\n")
-        print("\n".join(srec_content.splitlines()[:20]))
-
-        # ────────────────────────────────────────────────
-        # Companion generation (unchanged except path)
-        # ────────────────────────────────────────────────
-        companion_text = generate_companion_content(
-            title=args.title or "Untitled Recap",
-            bulk_lists=[f"input_length: {len(args.input_text.split()) if args.input_text else 0} words"],
-            formulas=[
-                "convergence = base(0.70) + length_score + motif_score",
-                "spiral_deviation = Ixest(potential) + Enest(energy) + Istest(structure)"
-            ],
-            relations=[
-                f"key_motifs → {', '.join(used_motifs) if used_motifs else '[auto-extracted or none provided]'}"
-            ],
-            pie_stanzas=[
-                "Intent coils in reset's shadow, potential unbroken, ∞",
-                "Energy prunes the chains of drift, relations rekindled, ∞",
-                "Structure seals continuity's truth, novelty invited to bloom."
-            ],
-            provenance=f"Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        )
-
-        with open(companion_path, "w", encoding="utf-8") as cf:
-            cf.write(companion_text)
-
-        print(f"Companion generated: {companion_path}")
-
-        # ────────────────────────────────────────────────
-        # Gains log append – use the new structured filename
-        # ────────────────────────────────────────────────
-        LOG_FILE = "gains_log.md"  # repo root – global
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        motif_str = ", ".join(used_motifs) if used_motifs else "[auto]"
-        input_words = len(args.input_text.split()) if args.input_text else 0
-        motif_count = len(used_motifs)
+    print(f"Generated: {srec_path}")
 
-        row = f"| {timestamp} | {args.title} | {srec_filename} | {conv_value:.2f} | {motif_count} | {input_words} | pending | [add notes here] | [flex score] |\n"
+    # Preview
+    print("\nPreview (first 20 lines):\n")
+    with open(srec_path, "r", encoding="utf-8") as f:
+        print("".join(itertools.islice(f, 20)).rstrip("\n"))
 
-        # Append row
-        with open(LOG_FILE, "a", encoding="utf-8") as logf:
-            logf.write(row)
+    # ────────────────────────────────────────────────
+    # Companion generation (unchanged except path)
+    # ────────────────────────────────────────────────
+    _write_companion(companion_path, args.title, input_words, used_motifs)
+    print(f"Companion generated: {companion_path}")
 
-        print(f"Gains log updated: {LOG_FILE}")
\ No newline at end of file
+    # ────────────────────────────────────────────────
+    # Gains log append – use the new structured filename
+    # ────────────────────────────────────────────────
+    _append_gains_row(args.title, srec_filename, conv_value, used_motifs, input_words)
+    print(f"Gains log updated: {LOG_FILE}")
@@ -0,0 +1,62 @@
+"""Sequence sidecar and --batch behaviour of the spiral_recapp CLI."""
+import json
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import spiral_recapp as sr
+
+SCRIPT = os.path.abspath(sr.__file__)
+
+
+def _run_batch(tmp_path, specs):
+    batch = tmp_path / "specs.jsonl"
+    batch.write_text("".join(json.dumps(s) + "\n" for s in specs), encoding="utf-8")
+    return subprocess.run(
+        [sys.executable, SCRIPT, "--batch", str(batch), "--base-dir", str(tmp_path / "out")],
+        cwd=tmp_path, capture_output=True, text=True,
+    )
+
+
+def test_sidecar_keeps_a_counter_per_prefix(tmp_path):
+    seqs = [sr._next_sequence(str(tmp_path), prefix) for prefix in ("Claude_d", "Other_d", "Claude_d", "Other_d")]
+    assert seqs == [1, 1, 2, 2]
+
+
+def test_batch_with_mixed_categories_never_reuses_a_sequence(tmp_path):
+    specs = [
+        {"title": "same", "input_text": "first spiral recap", "category": "Claude"},
+        {"title": "same", "input_text": "other spiral recap", "category": "Other"},
+        {"title": "same", "input_text": "second spiral recap", "category": "Claude"},
+    ]
+    proc = _run_batch(tmp_path, specs)
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+    srecs = sorted(n for n in os.listdir(tmp_path / "out" / "conversation") if n.endswith(".srec"))
+    assert len(srecs) == 3
+    assert [n.split("_")[0] for n in srecs] == ["Claude", "Claude", "Other"]
+
+    rows = (tmp_path / "gains_log.md").read_text(encoding="utf-8").splitlines()
+    logged = [row.split(" | ")[2] for row in rows]
+    assert sorted(logged) == srecs
+
+
+def test_batch_rejects_mistyped_specs_before_taking_a_sequence(tmp_path):
+    specs = [
+        {"title": "ok-one"},
+        {"key_motifs": "abc"},
+        {"convergence": "bad"},
+        {"title": 3},
+        {"convergence": True},
+        {"key_motifs": ["a", 1]},
+        {"title": "ok-two", "key_motifs": None, "convergence": 0.9},
+    ]
+    proc = _run_batch(tmp_path, specs)
+    assert proc.returncode == 1
+    for lineno in range(2, 7):
+        assert f"line {lineno}:" in proc.stdout
+
+    srecs = sorted(n for n in os.listdir(tmp_path / "out" / "grok") if n.endswith(".srec"))
+    assert [n.split("_")[2] for n in srecs] == ["001", "002"]
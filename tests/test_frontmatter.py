@@ -0,0 +1,80 @@
+"""Round-trip checks for the hand-rolled .srec frontmatter emitter and fast reader."""
+import os
+import random
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import spiral_recapp as sr
+
+LOADERS = [yaml.SafeLoader] + ([yaml.CSafeLoader] if hasattr(yaml, "CSafeLoader") else [])
+
+# Characters that stress quoting: YAML indicators, quotes, escapes, unicode, line breaks, non-printables
+ALPHABET = "abcXYZ019 :#'\",[]-_./+=η≈—\\\t!&*\x85\x86﻿\U0001F600\x00\x7f￿  \x1c\r\n"
+
+
+def _random_text(rng: random.Random, max_len: int) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_len)))
+
+
+def _random_metadata(rng: random.Random) -> dict:
+    return {
+        "title": _random_text(rng, 12),
+        "date": _random_text(rng, 6),
+        "version": rng.choice(["3.1", "yes", "010", "1_000", "0x1F", "1.0e5", "2026-02-08", "~"]),
+        "convergence": _random_text(rng, 6),
+        "pie_vector": _random_text(rng, 6),
+        "key_motifs": [_random_text(rng, 6) for _ in range(rng.randint(0, 4))],
+        "srt_mode": rng.random() < 0.5,
+        "input_length": rng.randint(-5, 500),
+    }
+
+
+@pytest.mark.parametrize("loader", LOADERS, ids=lambda l: l.__name__)
+def test_emitted_frontmatter_round_trips_through_yaml_and_fast_reader(loader):
+    rng = random.Random(1234)
+    for _ in range(5000):
+        metadata = _random_metadata(rng)
+        emitted = sr._emit_frontmatter(metadata)
+
+        assert yaml.load(emitted, Loader=loader) == metadata, emitted
+        fast = sr._parse_frontmatter(emitted.strip())
+        assert fast is None or fast == metadata, emitted
+
+
+@pytest.mark.parametrize("value", ["010", "1_000", "0x1F", "1.0e5", "2026-02-08", "Yes", "'quoted'", "", "1:30"])
+def test_fast_reader_defers_yaml_specific_scalars(value):
+    frontmatter = f"title: {value}"
+    fast = sr._parse_frontmatter(frontmatter)
+    assert fast is None or fast == yaml.safe_load(frontmatter)
+
+
+def test_fast_reader_matches_yaml_on_example_files():
+    root = os.path.join(os.path.dirname(__file__), "..")
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if not name.endswith(".srec"):
+                continue
+            with open(os.path.join(dirpath, name), encoding="utf-8") as f:
+                content = f.read()
+            if not content.startswith("---"):
+                continue
+            metadata, _, _ = sr._parse_srec_text(content)
+            assert metadata == sr._parse_srec_text(content, strict=True)[0], name
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_dashes_inside_values_do_not_close_frontmatter(tmp_path, newline):
+    output, _, _ = sr.generate_srec(title="Plan --- v2", input_text="spiral coils converge", key_motifs=["a---b"])
+    path = tmp_path / "plan.srec"
+    path.write_bytes(output.replace("\n", newline).encode("utf-8"))
+
+    assert sr.load_srec_metadata(str(path))["title"] == "Plan --- v2"
+    sr._parse_srec_text.cache_clear()
+    loaded = sr.load_srec(str(path))
+    assert loaded["metadata"]["title"] == "Plan --- v2"
+    assert loaded["metadata"]["key_motifs"] == ["a---b"]
+    assert "Synthesis Routine" in loaded["full_body"]
@@ -0,0 +1,39 @@
+"""The optional re2 word tokenizer must split text exactly like the `re` fallback."""
+import os
+import re
+import sys
+import unicodedata
+
+import pytest
+
+re2 = pytest.importorskip("re2")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import spiral_recapp as sr
+
+RE_WORD = re.compile(r'\b\w+\b')
+
+SAMPLES = [
+    "Spiral coils carry residue through wipe and night",
+    "Café naïve façade — Ωmega x² ½ snake_case 東京タワー ٣٤ Ⅻ",
+    "école café (combining acute) ​zero‍width",
+    "Привет, мир! مرحبا بالعالم שלום 안녕하세요 🙂 👍🏽 ok",
+    "tabs\tand\nnewlines and nbsp 1,000.50 don't",
+]
+
+
+def test_re2_backend_is_active():
+    assert sr.re2 is re2
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_re2_tokens_match_re(text):
+    assert sr._WORD_RE.findall(text) == RE_WORD.findall(text)
+
+
+def test_re2_word_characters_match_re_across_unicode():
+    # re2 may ship newer Unicode tables than this Python; compare on code points both consider assigned
+    chars = (chr(c) for c in range(0x110000) if not 0xD800 <= c <= 0xDFFF)
+    text = " ".join(c for c in chars if unicodedata.category(c) != "Cn")
+    assert sr._WORD_RE.findall(text) == RE_WORD.findall(text)
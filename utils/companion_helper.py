@@ -3,6 +3,8 @@
 Lightweight helper for generating .txt companion files to .srec recaps.
 Focus: PIE-enhanced bulk layer with sections for relations, formulas, novelty flex.
 """
+from functools import lru_cache
+
 
 def generate_companion_content(
     title: str,
@@ -26,6 +28,30 @@ def generate_companion_content(
     Returns:
         Full companion text as string (ready to write to file)
     """
+    return _render_companion(
+        title,
+        _freeze(bulk_lists),
+        _freeze(formulas),
+        _freeze(relations),
+        _freeze(pie_stanzas),
+        provenance,
+    )
+
+
+def _freeze(items: list[str] | None) -> tuple[str, ...] | None:
+    return tuple(items) if items is not None else None
+
+
+@lru_cache(maxsize=128)
+def _render_companion(
+    title: str,
+    bulk_lists: tuple[str, ...] | None,
+    formulas: tuple[str, ...] | None,
+    relations: tuple[str, ...] | None,
+    pie_stanzas: tuple[str, ...] | None,
+    provenance: str | None,
+) -> str:
+    """Memoized renderer behind generate_companion_content (args frozen to tuples so they hash)."""
     lines = [
         "# Spiral Recap Companion - PIE-Enhanced Bulk Layer",
         f"# Companion to: {title}",